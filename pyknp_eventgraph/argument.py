@@ -1,4 +1,4 @@
-import collections
+import sys
 from logging import getLogger
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
@@ -17,6 +17,11 @@ if TYPE_CHECKING:
 logger = getLogger(__name__)
 
 
+def _pas_sort_key(item: Tuple[str, list]) -> int:
+    """Sort key for (case, arguments) pairs following PAS_ORDER."""
+    return PAS_ORDER.get(item[0], 99)
+
+
 class Argument(Component):
     """An argument supplements its predicate's information.
 
@@ -30,6 +35,27 @@ class Argument(Component):
         head_base_phrase (BasePhrase, optional): A head basic phrase.
     """
 
+    __slots__ = (
+        "pas",
+        "case",
+        "eid",
+        "flag",
+        "sdist",
+        "arg",
+        "head_base_phrase",
+        "_surf",
+        "_normalized_surf",
+        "_mrphs",
+        "_normalized_mrphs",
+        "_reps",
+        "_normalized_reps",
+        "_head_reps",
+        "_children",
+        "_adnominal_event_ids",
+        "_sentential_complement_event_ids",
+        "_modifiees",
+    )
+
     def __init__(self, pas: "PAS", case: str, eid: int, flag: str, sdist: int, arg: Optional[PyknpArgument] = None):
         self.pas: "PAS" = pas
         self.case: str = case
@@ -49,6 +75,7 @@ class Argument(Component):
         self._children = None
         self._adnominal_event_ids = None
         self._sentential_complement_event_ids = None
+        self._modifiees = None
 
     @property
     def tag(self) -> Optional[Tag]:
@@ -107,35 +134,37 @@ class Argument(Component):
     def head_reps(self) -> str:
         """A head representative string."""
         if self._head_reps is None:
-            if self.head_base_phrase.tag:  # Not an exophora.
-                head_reps = self.head_base_phrase.tag.head_prime_repname or self.head_base_phrase.tag.head_repname
+            head_base_phrase = self.head_base_phrase
+            tag = head_base_phrase.tag
+            if tag:  # Not an exophora.
+                head_reps = tag.head_prime_repname or tag.head_repname
                 if head_reps:
-                    self._head_reps = f"[{head_reps}]" if self.head_base_phrase.omitted_case else head_reps
+                    self._head_reps = f"[{head_reps}]" if head_base_phrase.omitted_case else head_reps
             self._head_reps = self._head_reps or self.normalized_reps
         return self._head_reps
 
     @property
     def adnominal_events(self) -> List["Event"]:
         """A list of events modifying this predicate as an adnominal."""
-        return [e for bp in self.head_base_phrase.modifiees(include_self=True) for e in bp.adnominal_events]
+        return [e for bp in self._get_modifiees() for e in bp.adnominal_events]
 
     @property
     def sentential_complement_events(self) -> List["Event"]:
         """A list of events modifying this predicate as an adnominal."""
-        return [e for bp in self.head_base_phrase.modifiees(include_self=True) for e in bp.sentential_complement_events]
+        return [e for bp in self._get_modifiees() for e in bp.sentential_complement_events]
 
     @property
     def adnominal_event_ids(self) -> List[int]:
         """A list of IDs of events modifying this predicate (adnominal)."""
         if self._adnominal_event_ids is None:
-            self._adnominal_event_ids = sorted(e.evid for e in self.adnominal_events)
+            self._adnominal_event_ids = sorted([e.evid for e in self.adnominal_events])
         return self._adnominal_event_ids
 
     @property
     def sentential_complement_event_ids(self) -> List[int]:
         """A list of IDs of events modifying this predicate (sentential complement)."""
         if self._sentential_complement_event_ids is None:
-            self._sentential_complement_event_ids = sorted(e.evid for e in self.sentential_complement_events)
+            self._sentential_complement_event_ids = sorted([e.evid for e in self.sentential_complement_events])
         return self._sentential_complement_event_ids
 
     @property
@@ -143,21 +172,27 @@ class Argument(Component):
         """A list of child words."""
         if self._children is None:
             self._children = []
+            append, format_mrphs = self._children.append, self._format_mrphs
             for bp in reversed(self.head_base_phrase.modifiers()):
-                self._children.append(
+                # Truncate the morphemes once, and derive all the text variants from them.
+                tag = bp.tag
+                features = tag.features
+                mrphs = tag.mrph_list()  # Only read below, so the tag's own list can be used as is.
+                truncated_mrphs = self._truncate_mrphs(mrphs)
+                mrphs_text = format_mrphs(mrphs, "mrphs", normalize=False)
+                normalized_mrphs_text = format_mrphs(truncated_mrphs, "mrphs", normalize=True)
+                append(
                     {
-                        "surf": convert_mrphs_to_surf(self._base_phrase_to_text(bp, mode="mrphs", truncate=False)),
-                        "normalized_surf": convert_mrphs_to_surf(
-                            self._base_phrase_to_text(bp, mode="mrphs", truncate=True)
-                        ),
-                        "mrphs": self._base_phrase_to_text(bp, mode="mrphs", truncate=False),
-                        "normalized_mrphs": self._base_phrase_to_text(bp, mode="mrphs", truncate=True),
-                        "reps": self._base_phrase_to_text(bp, mode="reps", truncate=False),
-                        "normalized_reps": self._base_phrase_to_text(bp, mode="reps", truncate=True),
+                        "surf": convert_mrphs_to_surf(mrphs_text),
+                        "normalized_surf": convert_mrphs_to_surf(normalized_mrphs_text),
+                        "mrphs": mrphs_text,
+                        "normalized_mrphs": normalized_mrphs_text,
+                        "reps": format_mrphs(mrphs, "reps", normalize=False),
+                        "normalized_reps": format_mrphs(truncated_mrphs, "reps", normalize=True),
                         "adnominal_event_ids": [e.evid for e in bp.adnominal_events],
                         "sentential_complement_event_ids": [e.evid for e in bp.sentential_complement_events],
-                        "modifier": "修飾" in bp.tag.features,
-                        "possessive": bp.tag.features.get("係", "") == "ノ格",
+                        "modifier": "修飾" in features,
+                        "possessive": features.get("係", "") == "ノ格",
                     }
                 )
         return self._children
@@ -179,7 +214,9 @@ class Argument(Component):
         spans = []
         start_mrph_id = None
         prev_mrph_id = None
-        for bp in filter(lambda bp: not bp.omitted_case, self.get_constituent_base_phrases()):
+        for bp in self.get_constituent_base_phrases():
+            if bp.omitted_case:
+                continue
             for mrph in bp.morphemes:
                 if start_mrph_id is None:
                     start_mrph_id = mrph.mrph_id
@@ -191,6 +228,12 @@ class Argument(Component):
             spans.append((start_mrph_id, prev_mrph_id + 1))
         return spans
 
+    def _get_modifiees(self) -> List[BasePhrase]:
+        """Return the head base phrase followed by the base phrases it modifies, walking the chain only once."""
+        if self._modifiees is None:
+            self._modifiees = self.head_base_phrase.modifiees(include_self=True)
+        return self._modifiees
+
     def _base_phrase_to_text(
         self, bp: BasePhrase, mode: str = "mrphs", truncate: bool = False, include_modifiees: bool = False
     ) -> str:
@@ -207,14 +250,15 @@ class Argument(Component):
             if bp.exophora:
                 base = bp.exophora
             else:
-                mrphs = self._truncate_mrphs(list(bp.tag.mrph_list()))
+                mrphs = self._truncate_mrphs(bp.tag.mrph_list())
                 base = self._format_mrphs(mrphs, mode, normalize=True)
             case = convert_katakana_to_hiragana(self.case)
             case = case if mode == "mrphs" else f"{case}/{case}"
             return f"[{base}]" if truncate else f"[{base} {case}]"
         else:
-            mrphs = list(bp.tag.mrph_list())
+            mrphs = bp.tag.mrph_list()
             if include_modifiees:
+                mrphs = list(mrphs)  # Copy so that extending it leaves the tag's own list intact.
                 for parent_base_phrase in bp.modifiees():
                     mrphs += parent_base_phrase.tag.mrph_list()
             if truncate:
@@ -251,32 +295,32 @@ class Argument(Component):
         """
         assert mode in {"mrphs", "reps"}
         if mode == "reps":
-            return " ".join(mrph.repname or f"{mrph.midasi}/{mrph.midasi}" for mrph in mrphs)
+            return " ".join([mrph.repname or f"{mrph.midasi}/{mrph.midasi}" for mrph in mrphs])
         else:
             if normalize:
                 # Change the last morpheme to its infinitive (i.e., genkei).
                 # Strip the return string for the case that len(mrphs) == 1.
-                return (" ".join(mrph.midasi for mrph in mrphs[:-1]) + " " + mrphs[-1].genkei).strip()
+                return (" ".join([mrph.midasi for mrph in mrphs[:-1]]) + " " + mrphs[-1].genkei).strip()
             else:
-                return " ".join(mrph.midasi for mrph in mrphs)
+                return " ".join([mrph.midasi for mrph in mrphs])
 
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
-        return dict(
-            surf=self.surf,
-            normalized_surf=self.normalized_surf,
-            mrphs=self.mrphs,
-            normalized_mrphs=self.normalized_mrphs,
-            reps=self.reps,
-            normalized_reps=self.normalized_reps,
-            head_reps=self.head_reps,
-            eid=self.eid,
-            flag=self.flag,
-            sdist=self.sdist,
-            adnominal_event_ids=self.adnominal_event_ids,
-            sentential_complement_event_ids=self.sentential_complement_event_ids,
-            children=self.children,
-        )
+        return {
+            "surf": self.surf,
+            "normalized_surf": self.normalized_surf,
+            "mrphs": self.mrphs,
+            "normalized_mrphs": self.normalized_mrphs,
+            "reps": self.reps,
+            "normalized_reps": self.normalized_reps,
+            "head_reps": self.head_reps,
+            "eid": self.eid,
+            "flag": self.flag,
+            "sdist": self.sdist,
+            "adnominal_event_ids": self.adnominal_event_ids,
+            "sentential_complement_event_ids": self.sentential_complement_event_ids,
+            "children": self.children,
+        }
 
     def to_string(self) -> str:
         """Convert this object into a string."""
@@ -312,19 +356,21 @@ class JsonArgumentBuilder(Builder):
 class ArgumentsBuilder(Builder):
     @classmethod
     def build(cls, pas: "PAS") -> Dict[str, List[Argument]]:
-        arguments: Dict[str, List[Argument]] = collections.defaultdict(list)
+        # ArgumentBuilder registers each argument to the PAS, so there is no need to collect them again here.
         if pas.pas:
-            for case, args in sorted(pas.pas.arguments.items(), key=lambda x: PAS_ORDER.get(x[0], 99)):
-                for arg in sorted(args, key=lambda _arg: (pas.ssid - _arg.sdist, _arg.tid)):
-                    arguments[case].append(ArgumentBuilder.build(pas, case, arg))
-        return arguments
+            ssid = pas.ssid
+            # Intern the cases first so that both the sort and the PAS_ORDER lookups match by identity.
+            cases = [(sys.intern(case), args) for case, args in pas.pas.arguments.items()]
+            for case, args in sorted(cases, key=_pas_sort_key):
+                for arg in sorted(args, key=lambda _arg: (ssid - _arg.sdist, _arg.tid)):
+                    ArgumentBuilder.build(pas, case, arg)
+        return pas.arguments
 
 
 class JsonArgumentsBuilder(Builder):
     @classmethod
     def build(cls, pas: "PAS", dump: dict) -> Dict[str, List[Argument]]:
-        arguments: Dict[str, List[Argument]] = collections.defaultdict(list)
         for case, arguments_dump in dump.items():
             for argument_dump in arguments_dump:
-                arguments[case].append(JsonArgumentBuilder.build(pas, case, argument_dump))
-        return arguments
+                JsonArgumentBuilder.build(pas, case, argument_dump)
+        return pas.arguments
@@ -31,6 +31,20 @@ class BasePhrase(Component):
         children (List[BasePhrase]): A list of child base phrases.
     """
 
+    __slots__ = (
+        "event",
+        "tag",
+        "ssid",
+        "bid",
+        "tid",
+        "is_child",
+        "exophora",
+        "omitted_case",
+        "parent",
+        "children",
+        "_surf",
+    )
+
     def __init__(
         self,
         event: "Event",
@@ -82,7 +96,7 @@ class BasePhrase(Component):
                     mrphs.append(mrph)
             mrphs.append(self.omitted_case)
         else:
-            mrphs.extend(list(self.tag.mrph_list()))
+            mrphs.extend(self.tag.mrph_list())
         return mrphs
 
     @property
@@ -92,11 +106,11 @@ class BasePhrase(Component):
             morphemes = self.morphemes
             if self.omitted_case:
                 bases, case = morphemes[:-1], morphemes[-1]
-                base = "".join(base if isinstance(base, str) else base.midasi for base in bases)
+                base = "".join([base if isinstance(base, str) else base.midasi for base in bases])
                 case = convert_katakana_to_hiragana(case)
                 self._surf = f"[{base}{case}]"
             else:
-                self._surf = "".join(mrph.midasi for mrph in morphemes)
+                self._surf = "".join([mrph.midasi for mrph in morphemes])
         return self._surf
 
     @property
@@ -114,6 +128,20 @@ class BasePhrase(Component):
         """True if this base phrase is the end of an event."""
         return bool(self.tag and any("節-区切" in tag.features for tag in [self.tag] + get_parallel_tags(self.tag)))
 
+    @property
+    def is_event_head_or_end(self) -> bool:
+        """True if this base phrase is the head or the end of an event."""
+        if not self.tag:
+            return False
+        features = self.tag.features
+        if "節-主辞" in features or "節-区切" in features:
+            return True
+        for tag in get_parallel_tags(self.tag):
+            features = tag.features
+            if "節-主辞" in features or "節-区切" in features:
+                return True
+        return False
+
     @property
     def adnominal_events(self) -> List["Event"]:
         """A list of events modifying this predicate (adnominal)."""
@@ -140,7 +168,7 @@ class BasePhrase(Component):
 
     def to_list(self) -> List["BasePhrase"]:
         """Expand to a list."""
-        return sorted(self.root.modifiers(include_self=True))
+        return self.root.modifiers(include_self=True)  # Already sorted.
 
     def modifiees(self, include_self: bool = False) -> List["BasePhrase"]:
         """Return a list of base phrases modified by this base phrase.
@@ -149,13 +177,10 @@ class BasePhrase(Component):
             include_self: If true, include this base phrase to the return.
         """
         modifiee_bps = [self] if include_self else []
-
-        def add_modifiee(bp: BasePhrase):
-            if bp.parent:
-                modifiee_bps.append(bp.parent)
-                add_modifiee(bp.parent)
-
-        add_modifiee(self)
+        bp = self.parent
+        while bp:
+            modifiee_bps.append(bp)
+            bp = bp.parent
         return modifiee_bps
 
     def modifiers(self, include_self: bool = False) -> List["BasePhrase"]:
@@ -165,18 +190,16 @@ class BasePhrase(Component):
             include_self: If true, include this base phrase to the return.
         """
         modifier_bps = [self] if include_self else []
-
-        def add_modifier(bp: BasePhrase):
-            for child_bp in bp.children:
-                modifier_bps.append(child_bp)
-                add_modifier(child_bp)
-
-        add_modifier(self)
+        stack = self.children[::-1]  # Visit children in the pre-order.
+        while stack:
+            bp = stack.pop()
+            modifier_bps.append(bp)
+            stack.extend(reversed(bp.children))
         return sorted(modifier_bps)
 
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
-        return dict(ssid=self.ssid, bid=self.bid, tid=self.tid, surf=self.surf)
+        return {"ssid": self.ssid, "bid": self.bid, "tid": self.tid, "surf": self.surf}
 
     def to_string(self) -> str:
         """Convert this object into a string."""
@@ -259,7 +282,10 @@ class BasePhraseBuilder(Builder):
     def _add_children(cls, parent_bp: BasePhrase, ssid: int, sentinels: List[BasePhrase] = None) -> NoReturn:
         sentinel_tags = {sentinel.tag for sentinel in sentinels} if sentinels else {}
         for child_tag in parent_bp.tag.children:  # type: Tag
-            if child_tag in sentinel_tags or "節-主辞" in child_tag.features or "節-区切" in child_tag.features:
+            if child_tag in sentinel_tags:
+                continue
+            features = child_tag.features
+            if "節-主辞" in features or "節-区切" in features:
                 continue
             tid = child_tag.tag_id
             bid = Builder.ssid_tid_bid_map.get((ssid, tid), -1)
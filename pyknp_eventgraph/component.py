@@ -5,9 +5,27 @@ from abc import ABC, abstractmethod
 class Component(ABC):
     """The base of EventGraph components."""
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return self.to_string()
 
+    def __setstate__(self, state) -> None:
+        """Restore the state of this object from a pickle.
+
+        Pickles saved before components declared ``__slots__`` carry their state as a dictionary, so the
+        attributes are set one by one. Slots missing from the state, such as caches added later, default to None.
+        """
+        if isinstance(state, tuple):  # A pair of the dictionary state and the slot state.
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        for key, value in state.items():
+            setattr(self, key, value)
+        for cls in type(self).__mro__:
+            for key in getattr(cls, "__slots__", ()):
+                if not hasattr(self, key):
+                    setattr(self, key, None)
+
     @abstractmethod
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
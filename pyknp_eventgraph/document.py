@@ -29,7 +29,7 @@ class Document(Component):
 
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
-        return dict(sentences=[sentence.to_dict() for sentence in self.sentences])
+        return {"sentences": [sentence.to_dict() for sentence in self.sentences]}
 
     def to_string(self) -> str:
         """Convert this object into a string."""
@@ -1,4 +1,5 @@
 import collections
+import operator
 from logging import getLogger
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
@@ -21,6 +22,8 @@ Morpheme_ = Union[str, Morpheme]
 
 logger = getLogger(__name__)
 
+_evid_key = operator.attrgetter("evid")
+
 
 class Event(Component):
     """Event is the basic information unit of EventGraph. Event is closely related to PAS but more
@@ -84,6 +87,7 @@ class Event(Component):
         self._normalized_reps = None
         self._normalized_reps_with_mark = None
         self._content_rep_list = None
+        self._constituent_base_phrases: Dict[Tuple[bool, bool], List[BasePhrase]] = {}
 
     @property
     def event_id(self) -> int:
@@ -104,14 +108,14 @@ class Event(Component):
     def surf(self) -> str:
         """A surface string."""
         if self._surf is None:
-            self._surf = self.surf_()
+            self._surf = convert_mrphs_to_surf(self.mrphs)  # Reuse the cached tokens instead of rebuilding them.
         return self._surf
 
     @property
     def surf_with_mark(self) -> str:
         """A surface string with marks."""
         if self._surf_with_mark is None:
-            self._surf_with_mark = self.surf_with_mark_()
+            self._surf_with_mark = convert_mrphs_to_surf(self.mrphs_with_mark)
         return self._surf_with_mark
 
     @property
@@ -197,7 +201,9 @@ class Event(Component):
         spans = []
         start_mrph_id = None
         prev_mrph_id = None
-        for bp in filter(lambda bp: not bp.omitted_case, self.get_constituent_base_phrases()):
+        for bp in self.get_constituent_base_phrases():
+            if bp.omitted_case:
+                continue
             for mrph in bp.morphemes:
                 if start_mrph_id is None:
                     start_mrph_id = mrph.mrph_id
@@ -336,6 +342,23 @@ class Event(Component):
             logger.warning("This function is unavailable because this object is deserialized from a JSON file")
             return
 
+        # The result only depends on the flags, and every text representation of this event asks for it.
+        # Events pickled before the cache was introduced do not have it.
+        cache = getattr(self, "_constituent_base_phrases", None)
+        if cache is None:
+            cache = self._constituent_base_phrases = {}
+        key = (exclude_omission, exclude_exophora)
+        if key not in cache:
+            cache[key] = self._collect_constituent_base_phrases(exclude_omission, exclude_exophora)
+        return list(cache[key])
+
+    def _collect_constituent_base_phrases(self, exclude_omission: bool, exclude_exophora: bool) -> List[BasePhrase]:
+        """Collect base phrases belonging to this event.
+
+        Args:
+            exclude_omission: If true, omitted base phrases will be excluded.
+            exclude_exophora: If true, exophora will be excluded.
+        """
         head_bps = [self.pas.predicate.head_base_phrase]
         for args in self.pas.arguments.values():
             for arg in args:
@@ -348,12 +371,19 @@ class Event(Component):
                         continue
                     head_bps.append(arg.head_base_phrase)
                     continue
-                if arg.head_base_phrase.is_event_head or arg.head_base_phrase.is_event_end:
+                if arg.head_base_phrase.is_event_head_or_end:
                     continue
                 if arg.head_base_phrase.tag.tag_id > self.end.tag_id:
                     continue
                 head_bps.append(arg.head_base_phrase)
-        return sorted(list(set(bp for head_bp in head_bps for bp in head_bp.to_list())))
+
+        # Deduplicate base phrases by their keys and sort the keys, which avoids comparing base phrases themselves.
+        seen: Dict[Tuple[int, int, int, int], BasePhrase] = {}
+        for head_bp in head_bps:
+            for bp in head_bp.to_list():
+                if bp.key not in seen:
+                    seen[bp.key] = bp
+        return [seen[key] for key in sorted(seen)]
 
     def _to_text(
         self,
@@ -378,7 +408,7 @@ class Event(Component):
 
         bps = self.get_constituent_base_phrases(exclude_omission, exclude_exophora)
         bucket = collections.defaultdict(list)
-        for bp in sorted(bps):
+        for bp in bps:  # Already sorted by get_constituent_base_phrases.
             bucket[bp.key[:-1]].append(bp)  # bp.key[-1] is the tag id.
         grouped_bps = list(bucket.values())  # In Python 3.6+, dictionaries are insertion ordered.
         grouped_mrphs = [[morpheme for bp in bps for morpheme in bp.morphemes] for bps in grouped_bps]
@@ -509,14 +539,14 @@ class Event(Component):
                 continue
 
             if add_mark or include_modifiers:
-                adnominal_events = sorted([e for bp in bps for e in bp.adnominal_events], key=lambda e: e.evid)
+                adnominal_events = sorted([e for bp in bps for e in bp.adnominal_events], key=_evid_key)
                 if adnominal_events:
                     if include_modifiers:
                         additional_texts[start_pos] = " ".join(get_event_str(e) for e in adnominal_events)
                     else:
                         additional_texts[start_pos] = "▼"
                 sentential_complement_events = sorted(
-                    [e for bp in bps for e in bp.sentential_complement_events], key=lambda e: e.evid
+                    [e for bp in bps for e in bp.sentential_complement_events], key=_evid_key
                 )
                 if sentential_complement_events:
                     if include_modifiers:
@@ -589,27 +619,27 @@ class Event(Component):
 
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
-        return dict(
-            event_id=self.evid,
-            sid=self.sid,
-            ssid=self.ssid,
-            rel=[r.to_dict() for r in self.outgoing_relations],
-            surf=self.surf,
-            surf_with_mark=self.surf_with_mark,
-            mrphs=self.mrphs,
-            mrphs_with_mark=self.mrphs_with_mark,
-            normalized_mrphs=self.normalized_mrphs,
-            normalized_mrphs_with_mark=self.normalized_mrphs_with_mark,
-            normalized_mrphs_without_exophora=self.normalized_mrphs_without_exophora,
-            normalized_mrphs_with_mark_without_exophora=self.normalized_mrphs_with_mark_without_exophora,
-            reps=self.reps,
-            reps_with_mark=self.reps_with_mark,
-            normalized_reps=self.normalized_reps,
-            normalized_reps_with_mark=self.normalized_reps_with_mark,
-            content_rep_list=self.content_rep_list,
-            pas=self.pas.to_dict(),
-            features=self.features.to_dict(),
-        )
+        return {
+            "event_id": self.evid,
+            "sid": self.sid,
+            "ssid": self.ssid,
+            "rel": [r.to_dict() for r in self.outgoing_relations],
+            "surf": self.surf,
+            "surf_with_mark": self.surf_with_mark,
+            "mrphs": self.mrphs,
+            "mrphs_with_mark": self.mrphs_with_mark,
+            "normalized_mrphs": self.normalized_mrphs,
+            "normalized_mrphs_with_mark": self.normalized_mrphs_with_mark,
+            "normalized_mrphs_without_exophora": self.normalized_mrphs_without_exophora,
+            "normalized_mrphs_with_mark_without_exophora": self.normalized_mrphs_with_mark_without_exophora,
+            "reps": self.reps,
+            "reps_with_mark": self.reps_with_mark,
+            "normalized_reps": self.normalized_reps,
+            "normalized_reps_with_mark": self.normalized_reps_with_mark,
+            "content_rep_list": self.content_rep_list,
+            "pas": self.pas.to_dict(),
+            "features": self.features.to_dict(),
+        }
 
     def to_string(self) -> str:
         """Convert this object into a string."""
@@ -624,9 +654,11 @@ class EventBuilder(Builder):
         FeaturesBuilder.build(event)
         sentence.events.append(event)
         Builder.evid += 1
+        sid = sentence.sid
+        ssid = sentence.ssid
         for tid in range(start.tag_id, end.tag_id + 1):
-            Builder.sid_tid_event_map[(sentence.sid, tid)] = event
-            Builder.ssid_tid_event_map[(sentence.ssid, tid)] = event
+            Builder.sid_tid_event_map[(sid, tid)] = event
+            Builder.ssid_tid_event_map[(ssid, tid)] = event
         return event
 
 
@@ -123,10 +123,10 @@ class EventGraph(Component):
 
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
-        return dict(
-            sentences=[sentence.to_dict() for sentence in self.sentences],
-            events=[event.to_dict() for event in self.events],
-        )
+        return {
+            "sentences": [sentence.to_dict() for sentence in self.sentences],
+            "events": [event.to_dict() for event in self.events],
+        }
 
     def to_string(self) -> str:
         """Convert this object into a string."""
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+MODALITY_PAT = re.compile("<モダリティ-(.+?)>")
+TENSE_PAT = re.compile("<時制[-:](.+?)>")
+
 
 class Features(Component):
     """Features provides linguistic information of an event.
@@ -30,6 +33,16 @@ class Features(Component):
         level (str, optional): The semantic heaviness of a predicate.
     """
 
+    __slots__ = (
+        "event",
+        "modality",
+        "tense",
+        "negation",
+        "state",
+        "complement",
+        "level",
+    )
+
     def __init__(
         self,
         event: "Event",
@@ -50,13 +63,13 @@ class Features(Component):
 
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
-        return dict(
-            modality=self.modality,
-            tense=self.tense,
-            negation=self.negation,
-            state=self.state,
-            complement=self.complement,
-        )
+        return {
+            "modality": self.modality,
+            "tense": self.tense,
+            "negation": self.negation,
+            "state": self.state,
+            "complement": self.complement,
+        }
 
     def to_string(self) -> str:
         """Convert this object into a string."""
@@ -100,15 +113,18 @@ class FeaturesBuilder(Builder):
 
     @classmethod
     def _find_modality(cls, head: Tag, func_tag: Tag) -> List[str]:
-        modality = re.findall("<モダリティ-(.+?)>", func_tag.fstring)
-        if head.parent and ("弱用言" in head.parent.features or "思う能動" in head.parent.features):
-            modality.append("推量・伝聞")
+        fstring = func_tag.fstring
+        modality = MODALITY_PAT.findall(fstring) if "<モダリティ-" in fstring else []
+        parent = head.parent
+        if parent and ("弱用言" in parent.features or "思う能動" in parent.features):
+            modality = modality + ["推量・伝聞"]
         return modality
 
     @classmethod
     def _find_tense(cls, func_tag: Tag) -> str:
-        if "<時制" in func_tag.fstring:
-            return re.search("<時制[-:](.+?)>", func_tag.fstring).group(1)
+        fstring = func_tag.fstring
+        if "<時制" in fstring:
+            return TENSE_PAT.search(fstring).group(1)
         return "unknown"
 
     @classmethod
@@ -1,9 +1,18 @@
 import re
+import sys
 from typing import List
 
 from pyknp import Tag, BList, Features, JUMAN_FORMAT
 
-PAS_ORDER = {"ガ２": 0, "ガ": 1, "ヲ": 2, "ニ": 3}
+# Read-only; a plain dict keeps lookups on the hot path cheap. Non-ASCII literals are not interned automatically,
+# so the cases are interned here to let lookups with interned case strings match by identity.
+PAS_ORDER = {sys.intern("ガ２"): 0, sys.intern("ガ"): 1, sys.intern("ヲ"): 2, sys.intern("ニ"): 3}
+REL_TAG_PAT = re.compile(
+    r'<rel type="(?P<type>\S+?)"( mode="(?P<mode>[^>]+?)")? target="(?P<target>.+?)"( sid="(?P<sid>.*?)" '
+    r'id="(?P<id>\d+?)")?/>'
+)
+KATAKANA_TO_HIRAGANA_TABLE = {code: code - 96 for code in range(ord("ァ"), ord("ン") + 1)}
+MRPHS_TO_SURF_TABLE = str.maketrans({" ": None, "]": "] ", "|": " | ", "▼": "▼ ", "■": "■ ", "(": " ("})
 
 
 def get_parallel_tags(tag: Tag) -> List[Tag]:
@@ -16,9 +25,10 @@ def get_parallel_tags(tag: Tag) -> List[Tag]:
         A list of parallel tags.
     """
     parallels = []
+    append = parallels.append
     while tag.dpndtype == "P":
-        parallels.append(tag.parent)
         tag = tag.parent
+        append(tag)
     return parallels
 
 
@@ -31,63 +41,51 @@ def convert_katakana_to_hiragana(in_str: str) -> str:
     Returns:
         A string where katakana characters have been converted into hiragana.
     """
-    return "".join(chr(ord(ch) - 96) if ("ァ" <= ch <= "ン") else ch for ch in in_str)
+    return in_str.translate(KATAKANA_TO_HIRAGANA_TABLE)
 
 
 def convert_mrphs_to_surf(mrphs: str) -> str:
     """Remove unnecessary spaces from a tokenized surface string."""
-    surf = mrphs.replace(" ", "")
-    surf = surf.replace("]", "] ").replace("|", " | ").replace("▼", "▼ ").replace("■", "■ ").replace("(", " (")
-    return surf.strip()
+    # Drop the token separators and pad the marks in a single pass.
+    return mrphs.translate(MRPHS_TO_SURF_TABLE).strip()
 
 
 def preprocess_blist(blists: List[BList]) -> List[BList]:
     """Convert rel tag into PAS tag."""
     sid_ssid_map = {blist.sid: ssid for ssid, blist in enumerate(blists)}
-    pat = re.compile(
-        r'<rel type="(?P<type>\S+?)"( mode="(?P<mode>[^>]+?)")? target="(?P<target>.+?)"( sid="(?P<sid>.*?)" '
-        r'id="(?P<id>\d+?)")?/>'
-    )
+    finditer = REL_TAG_PAT.finditer
     ret = []
     pred = "_:_"  # TODO: Set the correct value for pred.
     for blist in blists:
+        blist_sid = blist.sid
+        blist_ssid = sid_ssid_map[blist_sid]
+        is_modified = False
         for tag in blist.tag_list():  # type: Tag
+            if "<rel " not in tag.fstring:
+                continue
+            parent_tid = tag.parent_id
+            child_tids = {t.tag_id for t in tag.children}
             args = []
-            for match in pat.finditer(tag.fstring):
-                if match.group("type") in PAS_ORDER:
-                    case = match.group("type")
-                    surf = match.group("target")
-                    sid = match.group("sid")
-                    if match.group("id") is not None:
-                        tid = int(match.group("id"))
-                    else:
-                        tid = -1
+            for match in finditer(tag.fstring):
+                case, _, _, surf, _, sid, tid = match.groups()
+                if case in PAS_ORDER:
+                    tid = int(tid) if tid is not None else -1
                     if sid is None:
                         flag = "E"
+                    elif sid != blist_sid or (tid != parent_tid and tid not in child_tids):
+                        flag = "O"
                     else:
-                        if sid != blist.sid:
-                            flag = "O"
-                        elif tid != tag.parent_id and tid not in [t.tag_id for t in tag.children]:
-                            flag = "O"
-                        else:
-                            flag = "N"
+                        flag = "N"
                     if sid in sid_ssid_map:
-                        sdist = sid_ssid_map[blist.sid] - sid_ssid_map[sid]
+                        sdist = blist_ssid - sid_ssid_map[sid]
                     else:
                         sdist = -1
                     # TODO: Set the correct value for eid.
                     eid = -1
-                    args.append(
-                        "{case}/{flag}/{surf}/{sdist}/{tid}/{eid}".format(
-                            case=case,
-                            flag=flag,
-                            surf=surf,
-                            sdist=sdist,
-                            tid=tid,
-                            eid=eid,
-                        )
-                    )
+                    args.append(f"{case}/{flag}/{surf}/{sdist}/{tid}/{eid}")
             if args:
                 tag.fstring += f"<述語項構造:{pred}:{';'.join(args)}>"
-        ret.append(BList(blist.spec()))
+                is_modified = True
+        # PAS tags are only read when parsing, so re-parse the BList only if it has been modified.
+        ret.append(BList(blist.spec()) if is_modified else blist)
     return ret
@@ -27,6 +27,15 @@ class PAS(Component):
         arguments (Dict[str, List[Argument]]): A mapping of a case to arguments.
     """
 
+    __slots__ = (
+        "event",
+        "sid",
+        "ssid",
+        "pas",
+        "predicate",
+        "arguments",
+    )
+
     def __init__(self, event: "Event", pas: Optional[PyknpPAS] = None):
         self.event: Event = event
         self.sid: str = event.sid
@@ -37,14 +46,17 @@ class PAS(Component):
 
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
-        return dict(
-            predicate=self.predicate.to_dict(),
-            argument={
-                case: [argument.to_dict() for argument in argument_list if argument.to_dict()]
-                for case, argument_list in self.arguments.items()
-                if any(argument.to_dict() for argument in argument_list)
-            },
-        )
+        arguments = {}
+        for case, argument_list in self.arguments.items():
+            # Convert each argument only once, then drop empty results.
+            argument_dicts = []
+            for argument in argument_list:
+                argument_dict = argument.to_dict()
+                if argument_dict:
+                    argument_dicts.append(argument_dict)
+            if argument_dicts:
+                arguments[case] = argument_dicts
+        return {"predicate": self.predicate.to_dict(), "argument": arguments}
 
     def to_string(self) -> str:
         """Convert this object into a string."""
@@ -25,6 +25,24 @@ class Predicate(Component):
         head_base_phrase (Token, optional): A head basic phrase.
     """
 
+    __slots__ = (
+        "pas",
+        "type_",
+        "head",
+        "head_base_phrase",
+        "_surf",
+        "_normalized_surf",
+        "_mrphs",
+        "_normalized_mrphs",
+        "_reps",
+        "_normalized_reps",
+        "_standard_reps",
+        "_children",
+        "_adnominal_event_ids",
+        "_sentential_complement_event_ids",
+        "_modifiees",
+    )
+
     def __init__(self, pas: "PAS", type_: str, head: Optional[Tag] = None):
         self.pas: PAS = pas
         self.type_: str = type_
@@ -41,6 +59,7 @@ class Predicate(Component):
         self._children = None
         self._adnominal_event_ids = None
         self._sentential_complement_event_ids = None
+        self._modifiees = None
 
     @property
     def tag(self) -> Optional[Tag]:
@@ -63,18 +82,7 @@ class Predicate(Component):
     def mrphs(self) -> str:
         """A tokenized string."""
         if self._mrphs is None:
-            mrphs = []
-            is_within_standard_repname = False
-            for bp in self.head_base_phrase.modifiees(include_self=True):
-                for m in bp.tag.mrph_list():
-                    if "用言表記先頭" in m.fstring:
-                        is_within_standard_repname = True
-                    if "用言表記末尾" in m.fstring:
-                        mrphs.append(m.genkei)  # Normalize the last morpheme.
-                        return " ".join(mrphs)
-                    if is_within_standard_repname:
-                        mrphs.append(m.midasi)
-            self._mrphs = " ".join(mrphs)
+            self._mrphs = " ".join(self._get_standard_repname_mrphs())
         return self._mrphs
 
     @property
@@ -86,14 +94,7 @@ class Predicate(Component):
     def reps(self) -> str:
         """A representative string."""
         if self._reps is None:
-            for bp in self.head_base_phrase.modifiees(include_self=True):
-                if "用言代表表記" in bp.tag.features:
-                    self._reps = bp.tag.features["用言代表表記"]
-                    break
-            else:
-                self._reps = self._base_phrase_to_text(
-                    self.head_base_phrase, mode="reps", truncate=True, include_modifiees=True
-                )
+            self._find_reps()
         return self._reps
 
     @property
@@ -105,12 +106,7 @@ class Predicate(Component):
     def standard_reps(self) -> str:
         """A standard representative string."""
         if self._standard_reps is None:
-            for bp in self.head_base_phrase.modifiees(include_self=True):
-                if "標準用言代表表記" in bp.tag.features:
-                    self._standard_reps = bp.tag.features["標準用言代表表記"]
-                    break
-            else:
-                self._standard_reps = self.reps
+            self._find_reps()
         return self._standard_reps
 
     @property
@@ -121,25 +117,25 @@ class Predicate(Component):
     @property
     def adnominal_events(self) -> List["Event"]:
         """A list of events modifying this predicate as an adnominal."""
-        return [e for bp in self.head_base_phrase.modifiees(include_self=True) for e in bp.adnominal_events]
+        return [e for bp in self._get_modifiees() for e in bp.adnominal_events]
 
     @property
     def sentential_complement_events(self) -> List["Event"]:
         """A list of events modifying this predicate as an adnominal."""
-        return [e for bp in self.head_base_phrase.modifiees(include_self=True) for e in bp.sentential_complement_events]
+        return [e for bp in self._get_modifiees() for e in bp.sentential_complement_events]
 
     @property
     def adnominal_event_ids(self) -> List[int]:
         """A list of IDs of events modifying this predicate (adnominal)."""
         if self._adnominal_event_ids is None:
-            self._adnominal_event_ids = sorted(e.evid for e in self.adnominal_events)
+            self._adnominal_event_ids = sorted([e.evid for e in self.adnominal_events])
         return self._adnominal_event_ids
 
     @property
     def sentential_complement_event_ids(self) -> List[int]:
         """A list of IDs of events modifying this predicate (sentential complement)."""
         if self._sentential_complement_event_ids is None:
-            self._sentential_complement_event_ids = sorted(e.evid for e in self.sentential_complement_events)
+            self._sentential_complement_event_ids = sorted([e.evid for e in self.sentential_complement_events])
         return self._sentential_complement_event_ids
 
     @property
@@ -147,21 +143,27 @@ class Predicate(Component):
         """A list of child words."""
         if self._children is None:
             self._children = []
+            append, format_mrphs = self._children.append, self._format_mrphs
             for bp in reversed(self.head_base_phrase.modifiers()):
-                self._children.append(
+                # Truncate the morphemes once, and derive all the text variants from them.
+                tag = bp.tag
+                features = tag.features
+                mrphs = tag.mrph_list()  # Only read below, so the tag's own list can be used as is.
+                truncated_mrphs = self._truncate_mrphs(mrphs)
+                mrphs_text = format_mrphs(mrphs, "mrphs", normalize=False)
+                normalized_mrphs_text = format_mrphs(truncated_mrphs, "mrphs", normalize=True)
+                append(
                     {
-                        "surf": convert_mrphs_to_surf(self._base_phrase_to_text(bp, mode="mrphs", truncate=False)),
-                        "normalized_surf": convert_mrphs_to_surf(
-                            self._base_phrase_to_text(bp, mode="mrphs", truncate=True)
-                        ),
-                        "mrphs": self._base_phrase_to_text(bp, mode="mrphs", truncate=False),
-                        "normalized_mrphs": self._base_phrase_to_text(bp, mode="mrphs", truncate=True),
-                        "reps": self._base_phrase_to_text(bp, mode="reps", truncate=False),
-                        "normalized_reps": self._base_phrase_to_text(bp, mode="reps", truncate=True),
+                        "surf": convert_mrphs_to_surf(mrphs_text),
+                        "normalized_surf": convert_mrphs_to_surf(normalized_mrphs_text),
+                        "mrphs": mrphs_text,
+                        "normalized_mrphs": normalized_mrphs_text,
+                        "reps": format_mrphs(mrphs, "reps", normalize=False),
+                        "normalized_reps": format_mrphs(truncated_mrphs, "reps", normalize=True),
                         "adnominal_event_ids": [event.evid for event in bp.adnominal_events],
                         "sentential_complement_event_ids": [event.evid for event in bp.sentential_complement_events],
-                        "modifier": "修飾" in bp.tag.features,
-                        "possessive": bp.tag.features.get("係", "") == "ノ格",
+                        "modifier": "修飾" in features,
+                        "possessive": features.get("係", "") == "ノ格",
                     }
                 )
         return self._children
@@ -183,7 +185,9 @@ class Predicate(Component):
         spans = []
         start_mrph_id = None
         prev_mrph_id = None
-        for bp in filter(lambda bp: not bp.omitted_case, self.get_constituent_base_phrases()):
+        for bp in self.get_constituent_base_phrases():
+            if bp.omitted_case:
+                continue
             for mrph in bp.morphemes:
                 if start_mrph_id is None:
                     start_mrph_id = mrph.mrph_id
@@ -195,6 +199,46 @@ class Predicate(Component):
             spans.append((start_mrph_id, prev_mrph_id + 1))
         return spans
 
+    def _find_reps(self) -> None:
+        """Fill the caches of the representative and standard representative strings in one walk up the modifiees."""
+        reps, standard_reps = None, None
+        for bp in self._get_modifiees():
+            features = bp.tag.features
+            if reps is None:
+                reps = features.get("用言代表表記")
+            if standard_reps is None:
+                standard_reps = features.get("標準用言代表表記")
+            if reps is not None and standard_reps is not None:
+                break
+        if reps is None:
+            reps = self._base_phrase_to_text(self.head_base_phrase, mode="reps", truncate=True, include_modifiees=True)
+        self._reps = reps
+        self._standard_reps = reps if standard_reps is None else standard_reps
+
+    def _get_modifiees(self) -> List[BasePhrase]:
+        """Return the head base phrase followed by the base phrases it modifies, walking the chain only once."""
+        if self._modifiees is None:
+            self._modifiees = self.head_base_phrase.modifiees(include_self=True)
+        return self._modifiees
+
+    def _get_standard_repname_mrphs(self) -> List[str]:
+        """Collect the morphemes spanning from the head to the end of the standard representative string."""
+        mrphs = []
+        is_within_standard_repname = False
+        for bp in self._get_modifiees():
+            for m in bp.tag.mrph_list():
+                fstring = m.fstring
+                # Most morphemes carry neither marker, so scan for their common prefix once before telling them apart.
+                if "用言表記" in fstring:
+                    if "用言表記先頭" in fstring:
+                        is_within_standard_repname = True
+                    if "用言表記末尾" in fstring:
+                        mrphs.append(m.genkei)  # Normalize the last morpheme.
+                        return mrphs
+                if is_within_standard_repname:
+                    mrphs.append(m.midasi)
+        return mrphs
+
     def _base_phrase_to_text(
         self, bp: BasePhrase, mode: str = "mrphs", truncate: bool = False, include_modifiees: bool = False
     ) -> str:
@@ -207,10 +251,11 @@ class Predicate(Component):
             include_modifiees: If true, parents are used to construct a compound phrase.
         """
         assert mode in {"mrphs", "reps"}
-        mrphs = list(bp.tag.mrph_list())
+        mrphs = bp.tag.mrph_list()
         if include_modifiees:
+            mrphs = list(mrphs)  # Copy so that extending it leaves the tag's own list intact.
             for parent_bp in bp.modifiees():
-                mrphs += list(parent_bp.tag.mrph_list())
+                mrphs += parent_bp.tag.mrph_list()
         if truncate:
             mrphs = self._truncate_mrphs(mrphs)
             return self._format_mrphs(mrphs, mode, normalize=True)
@@ -225,14 +270,16 @@ class Predicate(Component):
             mrphs: A list of morphemes.
 
         """
-        for index, mrph in reversed(list(enumerate(mrphs))):
-            if mrph.hinsi == "助動詞" and mrph.genkei == "です" and 0 < index and mrphs[index - 1].hinsi == "形容詞":
+        for index in range(len(mrphs) - 1, -1, -1):
+            mrph = mrphs[index]
+            hinsi, fstring = mrph.hinsi, mrph.fstring
+            if hinsi == "助動詞" and mrph.genkei == "です" and 0 < index and mrphs[index - 1].hinsi == "形容詞":
                 # adjective + 'です' -> ignore 'です' (e.g., 美しいです -> 美しい)
                 return mrphs[:index]
-            elif mrph.hinsi == "判定詞" and mrph.midasi == "じゃ" and 0 < index and "<活用語>" in mrphs[index - 1].fstring:
+            elif hinsi == "判定詞" and mrph.midasi == "じゃ" and 0 < index and "<活用語>" in mrphs[index - 1].fstring:
                 # adjective or verb +'じゃん' -> ignore 'じゃん' (e.g., 使えないじゃん -> 使えない)
                 return mrphs[:index]
-            elif ("<活用語>" in mrph.fstring or "<用言意味表記末尾>" in mrph.fstring) and mrph.genkei not in {"のだ", "んだ"}:
+            elif ("<活用語>" in fstring or "<用言意味表記末尾>" in fstring) and mrph.genkei not in {"のだ", "んだ"}:
                 # check the last word with conjugation except some meaningless words
                 return mrphs[: index + 1]
         return mrphs
@@ -249,34 +296,35 @@ class Predicate(Component):
         """
         assert mode in {"mrphs", "reps"}
         if mode == "reps":
-            return " ".join(mrph.repname or f"{mrph.midasi}/{mrph.midasi}" for mrph in mrphs)
+            return " ".join([mrph.repname or f"{mrph.midasi}/{mrph.midasi}" for mrph in mrphs])
         else:  # i.e., mode == 'mrphs'
             if normalize:
                 # Change the last morpheme to its infinitive (i.e., genkei)
-                base = " ".join(mrph.midasi for mrph in mrphs[:-1])
-                if mrphs[-1].hinsi == "助動詞" and mrphs[-1].genkei == "ぬ":
+                base = " ".join([mrph.midasi for mrph in mrphs[:-1]])
+                last_mrph = mrphs[-1]
+                if last_mrph.hinsi == "助動詞" and last_mrph.genkei == "ぬ":
                     # Exception to prevent transforming "できません" into "できませぬ".
-                    return f"{base} {mrphs[-1].midasi}".strip()
+                    return f"{base} {last_mrph.midasi}".strip()
                 else:
-                    return f"{base} {mrphs[-1].genkei}".strip()
+                    return f"{base} {last_mrph.genkei}".strip()
             else:
-                return " ".join(mrph.midasi for mrph in mrphs)
+                return " ".join([mrph.midasi for mrph in mrphs])
 
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
-        return dict(
-            surf=self.surf,
-            normalized_surf=self.normalized_surf,
-            mrphs=self.mrphs,
-            normalized_mrphs=self.normalized_mrphs,
-            reps=self.reps,
-            normalized_reps=self.normalized_reps,
-            standard_reps=self.standard_reps,
-            type=self.type,
-            adnominal_event_ids=self.adnominal_event_ids,
-            sentential_complement_event_ids=self.sentential_complement_event_ids,
-            children=self.children,
-        )
+        return {
+            "surf": self.surf,
+            "normalized_surf": self.normalized_surf,
+            "mrphs": self.mrphs,
+            "normalized_mrphs": self.normalized_mrphs,
+            "reps": self.reps,
+            "normalized_reps": self.normalized_reps,
+            "standard_reps": self.standard_reps,
+            "type": self.type,
+            "adnominal_event_ids": self.adnominal_event_ids,
+            "sentential_complement_event_ids": self.sentential_complement_event_ids,
+            "children": self.children,
+        }
 
     def to_string(self) -> str:
         """Convert this object into a string."""
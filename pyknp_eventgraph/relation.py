@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+RELATION_FEATURE_PAT = re.compile("<(?:談話関係:(?P<discourse>.+?)|節-機能-(?P<clause_function>.+?))>")
+
 
 class Relation(Component):
     """A relation connects two events.
@@ -32,6 +34,15 @@ class Relation(Component):
         reliable (bool): If true, a syntactic dependency is not ambiguous.
     """
 
+    __slots__ = (
+        "modifier",
+        "head",
+        "label",
+        "surf",
+        "head_tid",
+        "reliable",
+    )
+
     def __init__(self, modifier: "Event", head: "Event", label: str, surf: str, head_tid: int, reliable: bool):
         self.modifier: Optional[Event] = modifier
         self.head: Optional[Event] = head
@@ -42,9 +53,13 @@ class Relation(Component):
 
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
-        return dict(
-            event_id=self.head.evid, label=self.label, surf=self.surf, reliable=self.reliable, head_tid=self.head_tid
-        )
+        return {
+            "event_id": self.head.evid,
+            "label": self.label,
+            "surf": self.surf,
+            "reliable": self.reliable,
+            "head_tid": self.head_tid,
+        }
 
     def to_string(self) -> str:
         """Convert this object into a string."""
@@ -112,24 +127,35 @@ class RelationsBuilder(Builder):
         # Dependency ambiguity.
         if event.parent:
             reliable = [event.evid, event.parent.evid] == [event_.evid for event_ in event.sentence.events][-2:]
+            clause_boundary = event.end.features["節-区切"]
         else:
             reliable = False
+            clause_boundary = None
 
         # Adnominal.
-        if event.parent and event.end.features["節-区切"] == "連体修飾":
+        if clause_boundary == "連体修飾":
             relations.append(
                 RelationBuilder.build(event, event.parent, "連体修飾", head_tid=event.end.parent_id, reliable=reliable)
             )
 
         # Sentential complement.
-        if event.parent and event.end.features["節-区切"] == "補文":
+        if clause_boundary == "補文":
             relations.append(
                 RelationBuilder.build(event, event.parent, "補文", head_tid=event.end.parent_id, reliable=reliable)
             )
 
+        # Collect discourse relations and clausal functions in a single scan.
+        discourse_relations, clause_functions = [], []
+        if not relations:
+            for match in RELATION_FEATURE_PAT.finditer(event.end.fstring):
+                if match.lastgroup == "discourse":
+                    discourse_relations.append(match.group("discourse"))
+                else:
+                    clause_functions.append(match.group("clause_function"))
+
         # Discourse relation.
         if not relations:
-            for discourse_relation in re.findall("<談話関係:(.+?)>", event.end.fstring):
+            for discourse_relation in discourse_relations:
                 for item in discourse_relation.split(";"):
                     sid, tid, label = item.split("/")
                     head_event = Builder.sid_tid_event_map.get((sid, int(tid)), None)
@@ -140,7 +166,7 @@ class RelationsBuilder(Builder):
 
         # Clausal function.
         if not relations and event.parent:
-            for clause_function in re.findall("<節-機能-(.+?)>", event.end.fstring):
+            for clause_function in clause_functions:
                 if ":" in clause_function:
                     label, surf = clause_function.split(":")
                 else:
@@ -163,10 +189,12 @@ class RelationsBuilder(Builder):
 
     @classmethod
     def _find_parent(cls, event: "Event") -> Optional["Event"]:
+        parent_event_cands = [event_ for event_ in event.sentence.events if event.evid < event_.evid]
         parent_tag: Optional[Tag] = event.head.parent
         while parent_tag:
-            for parent_event_cand in filter(lambda event_: event.evid < event_.evid, event.sentence.events):
-                if parent_tag.tag_id in {parent_event_cand.head.tag_id, parent_event_cand.end.tag_id}:
+            tid = parent_tag.tag_id
+            for parent_event_cand in parent_event_cands:
+                if parent_event_cand.head.tag_id == tid or parent_event_cand.end.tag_id == tid:
                     return parent_event_cand
             parent_tag = parent_tag.parent
         return None
@@ -32,31 +32,34 @@ class Sentence(Component):
         self.blist: BList = blist
         self.events: List[Event] = []
 
+        self._surf = None
         self._mrphs = None
         self._reps = None
 
     @property
     def surf(self) -> str:
         """A surface string."""
-        return convert_mrphs_to_surf(self.mrphs)
+        if getattr(self, "_surf", None) is None:  # Sentences pickled before the cache was introduced lack it.
+            self._surf = convert_mrphs_to_surf(self.mrphs)
+        return self._surf
 
     @property
     def mrphs(self) -> str:
         """A tokenized surface string."""
         if self._mrphs is None:
-            self._mrphs = " ".join(m.midasi for m in self.blist.mrph_list())
+            self._mrphs = " ".join([m.midasi for m in self.blist.mrph_list()])
         return self._mrphs
 
     @property
     def reps(self) -> str:
         """A representative string."""
         if self._reps is None:
-            self._reps = " ".join(m.repname or f"{m.midasi}/{m.midasi}" for m in self.blist.mrph_list())
+            self._reps = " ".join([m.repname or f"{m.midasi}/{m.midasi}" for m in self.blist.mrph_list()])
         return self._reps
 
     def to_dict(self) -> dict:
         """Convert this object into a dictionary."""
-        return dict(sid=self.sid, ssid=self.ssid, surf=self.surf, mrphs=self.mrphs, reps=self.reps)
+        return {"sid": self.sid, "ssid": self.ssid, "surf": self.surf, "mrphs": self.mrphs, "reps": self.reps}
 
     def to_string(self) -> str:
         """Convert this object into a string."""
@@ -82,10 +85,14 @@ class SentenceBuilder(Builder):
                 start, end, head = None, None, None
         document.sentences.append(sentence)
         Builder.ssid += 1
+        ssid = sentence.ssid
+        ssid_tid_bid_map = Builder.ssid_tid_bid_map
+        ssid_tid_tag_map = Builder.ssid_tid_tag_map
         for bid, bnst in enumerate(blist.bnst_list()):
             for tag in bnst.tag_list():
-                Builder.ssid_tid_bid_map[(sentence.ssid, tag.tag_id)] = bid
-                Builder.ssid_tid_tag_map[(sentence.ssid, tag.tag_id)] = tag
+                key = (ssid, tag.tag_id)
+                ssid_tid_bid_map[key] = bid
+                ssid_tid_tag_map[key] = tag
         return sentence
 
 
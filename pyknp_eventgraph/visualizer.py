@@ -125,10 +125,10 @@ class Node:
         if self.event.pas.predicate.type_:
             pred += f":{self.event.pas.predicate.type_}"
         args = []
-        for case in sorted(self.event.pas.arguments, key=lambda x: PAS_ORDER.get(x, 99)):
-            arg = self.event.pas.arguments[case][0]
+        # Sort here because graphs loaded from JSON keep the case order of the file.
+        for case, arguments in sorted(self.event.pas.arguments.items(), key=lambda x: PAS_ORDER.get(x[0], 99)):
             if "外の関係" not in case:
-                args.append(f"{arg.head_reps}:{case}")
+                args.append(f"{arguments[0].head_reps}:{case}")
         return ", ".join([pred] + args)
 
     @property
@@ -0,0 +1,44 @@
+import glob
+import json
+import os
+import unittest
+
+from pyknp_eventgraph import EventGraph
+
+here = os.path.abspath(os.path.dirname(__file__))
+
+
+class TestEventGraph(unittest.TestCase):
+    """Tests loading EventGraphs pickled by earlier versions."""
+
+    def setUp(self):
+        """Setup files used for test EventGraph."""
+        self.pickle_file_paths = sorted(glob.glob(os.path.join(here, "pickle_files/*.pkl")))
+        self.json_file_paths = [
+            os.path.join(here, "json_files", os.path.splitext(os.path.basename(path))[0] + ".json")
+            for path in self.pickle_file_paths
+        ]
+
+    def test_load(self):
+        for path in self.pickle_file_paths:
+            with open(path, "rb") as f:
+                evg = EventGraph.load(f, binary=True)
+            assert isinstance(evg, EventGraph)
+            for event in evg.events:
+                assert event.pas.predicate.head_base_phrase.event is event
+                assert event.pas.predicate.head_base_phrase.tag is not None
+
+    def test_to_dict(self):
+        for pickle_file_path, json_file_path in zip(self.pickle_file_paths, self.json_file_paths):
+            with open(pickle_file_path, "rb") as f:
+                evg = EventGraph.load(f, binary=True)
+            with open(json_file_path, "rt", encoding="utf-8") as f:
+                assert evg.to_dict() == json.load(f)
+
+    def test_get_constituent_base_phrases(self):
+        for path in self.pickle_file_paths:
+            with open(path, "rb") as f:
+                evg = EventGraph.load(f, binary=True)
+            for event in evg.events:
+                assert event.get_constituent_base_phrases() == event.get_constituent_base_phrases()
+                assert event.pas.predicate.head_base_phrase in event.get_constituent_base_phrases()
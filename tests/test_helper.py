@@ -0,0 +1,93 @@
+import unittest
+
+from pyknp import BList
+
+from pyknp_eventgraph.helper import convert_katakana_to_hiragana, convert_mrphs_to_surf, preprocess_blist
+
+KNP_WITHOUT_REL = """# S-ID:1
+* 1D
++ 1D
+風 かぜ 風 名詞 6 普通名詞 1 * 0 * 0 NIL
+が が が 助詞 9 格助詞 1 * 0 * 0 NIL
+* -1D
++ -1D
+吹く ふく 吹く 動詞 2 * 0 子音動詞カ行 2 基本形 2 NIL
+EOS
+"""
+
+KNP_WITH_NON_PAS_REL = """# S-ID:2
+* 1D
++ 1D
+雨 あめ 雨 名詞 6 普通名詞 1 * 0 * 0 NIL
+が が が 助詞 9 格助詞 1 * 0 * 0 NIL
+* -1D
++ -1D <rel type="デ" target="外"/>
+降る ふる 降る 動詞 2 * 0 子音動詞ラ行 10 基本形 2 NIL
+EOS
+"""
+
+KNP_WITH_PAS_REL = """# S-ID:3
+* 1D
++ 1D
+雨 あめ 雨 名詞 6 普通名詞 1 * 0 * 0 NIL
+が が が 助詞 9 格助詞 1 * 0 * 0 NIL
+* 2D
++ 2D <rel type="ガ" target="雨" sid="3" id="0"/><rel type="ヲ" target="風" sid="1" id="0"/><rel type="ニ" target="著者"/>
+降って ふって 降る 動詞 2 * 0 子音動詞ラ行 10 タ系連用テ形 14 NIL
+* -1D
++ -1D <rel type="ガ" target="雨" sid="3" id="0"/><rel type="デ" target="外"/>
+止む やむ 止む 動詞 2 * 0 子音動詞マ行 9 基本形 2 NIL
+EOS
+"""
+
+KNP_WITH_PARENT_REL = """# S-ID:4
+* 1D
++ 1D <rel type="ガ" target="雨" sid="4" id="1"/>
+降った ふった 降る 動詞 2 * 0 子音動詞ラ行 10 タ形 10 NIL
+* -1D
++ -1D
+雨 あめ 雨 名詞 6 普通名詞 1 * 0 * 0 NIL
+EOS
+"""
+
+
+class TestHelper(unittest.TestCase):
+    """Tests helper functions."""
+
+    def test_convert_katakana_to_hiragana(self):
+        assert convert_katakana_to_hiragana("ガ") == "が"
+        assert convert_katakana_to_hiragana("ヲ") == "を"
+        assert convert_katakana_to_hiragana("ガ２") == "が２"
+        assert convert_katakana_to_hiragana("ァン漢字ーヴ") == "ぁん漢字ーヴ"
+
+    def test_convert_mrphs_to_surf(self):
+        assert convert_mrphs_to_surf("私 は 走る") == "私は走る"
+        assert convert_mrphs_to_surf("[ 彼 が ] 走る") == "[彼が] 走る"
+        assert convert_mrphs_to_surf("▼ 本 を 読む") == "▼ 本を読む"
+        assert convert_mrphs_to_surf("■ 本 を | 読む") == "■ 本を | 読む"
+        assert convert_mrphs_to_surf("美しい ( です )") == "美しい (です)"
+        assert convert_mrphs_to_surf("") == ""
+
+    def test_preprocess_blist_flags(self):
+        blists = [
+            BList(KNP_WITHOUT_REL),
+            BList(KNP_WITH_NON_PAS_REL),
+            BList(KNP_WITH_PAS_REL),
+            BList(KNP_WITH_PARENT_REL),
+        ]
+        ret = preprocess_blist(blists)
+        tags = ret[2].tag_list()
+        # N: a child in the same sentence; O: another sentence; E: exophora (no sid).
+        assert tags[1].fstring.endswith("<述語項構造:_:_:ガ/N/雨/0/0/-1;ヲ/O/風/2/0/-1;ニ/E/著者/-1/-1/-1>")
+        # O: neither the parent nor a child in the same sentence. Cases outside PAS_ORDER are ignored.
+        assert tags[2].fstring.endswith("<述語項構造:_:_:ガ/O/雨/0/0/-1>")
+        # N: the parent in the same sentence.
+        assert ret[3].tag_list()[0].fstring.endswith("<述語項構造:_:_:ガ/N/雨/0/1/-1>")
+
+    def test_preprocess_blist_passthrough(self):
+        blists = [BList(KNP_WITHOUT_REL), BList(KNP_WITH_NON_PAS_REL), BList(KNP_WITH_PAS_REL)]
+        ret = preprocess_blist(blists)
+        assert ret[0] is blists[0]
+        assert ret[1] is blists[1]
+        assert ret[2] is not blists[2]
+        assert "述語項構造" not in ret[1].tag_list()[1].fstring